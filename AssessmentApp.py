@@ -1,28 +1,35 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
-import base64
+import csv
 import hashlib
+import hmac
 from datetime import datetime
 import logging
 import sys
-import urllib.parse
-
-# Configure logging for Streamlit Cloud
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
-logger = logging.getLogger(__name__)
+from string import Template
+
+# Configure logging for Streamlit Cloud once per process; the script body reruns on every interaction.
+@st.cache_resource(show_spinner=False)
+def get_logger():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+    return logging.getLogger(__name__)
+
+logger = get_logger()
 
 st.set_page_config(page_title="Assessment Enhancements App", layout="wide", initial_sidebar_state="expanded")
 
 CSV_FILE = "assessment_data.csv"
 DEFAULT_DATA_FILE = "EVALUATOR_INPUT.csv"
-EVALUATOR_STORE = "evaluators.csv"
+EVALUATOR_STORE = "evaluators.parquet"
+LEGACY_EVALUATOR_STORE = "evaluators.csv"
 
 CSV_COLUMNS = [
     "Trainer ID", "Trainer Name", "Department", "DOJ", "Branch", "Discipline", "Course", "Date of assessment",
@@ -33,90 +40,265 @@ CSV_COLUMNS = [
     "LEVEL #1", "LEVEL #2", "LEVEL #3", "Status of Score Card", "Reminder", "Evaluator Username", "Evaluator Role"
 ]
 
+# The admin overview only needs identity and summary columns; the full row is shown per trainer.
+OVERVIEW_COLUMNS = [
+    "Trainer ID", "Trainer Name", "Department", "Branch", "Date of assessment", "TOTAL", "AVERAGE", "STATUS",
+    "LEVEL #1", "LEVEL #2", "LEVEL #3", "Evaluator Username", "Evaluator Role"
+]
+OVERVIEW_MAX_ROWS = 500
+
 EVALUATOR_COLUMNS = ["username", "password_hash", "full_name", "email", "role", "created_at"]
 
+# Built-in login accounts per role: (username, sha256 of the password).
+LOGIN_CREDENTIALS = {
+    "Viewer": ("omotec", "11f7afa17a422760072e41b541d45b15821f2302629b6f6a21031d55e5609bab"),
+    "Evaluator": ("omotec1", "f5fcd10100c914883f91eb1a00d9a3ee391de1f49a6daba38a736a4c072f791f"),
+    "Super_Administrator": ("omotec2", "eb53ad1e4f37094458b69c30939f74f3fd6d323eb9c0a3b014151cf8049bf36e"),
+}
+
+LOGO_FILE = "NEW LOGO - OMOTEC.png"
+BACKGROUND_IMAGES = {"Viewer": "background.jpg", "Evaluator": "background1.jpg", "Super_Administrator": "background2.jpg"}
+
+LEVELS = ("LEVEL #1", "LEVEL #2", "LEVEL #3")
+
+RELEVANT_PARAMS = {
+    "Technical Evaluator": (
+        "Has Knowledge of STEM (5)", "Ability to integrate STEM With related activities (10)",
+        "Discusses Up-to-date information related to STEM (5)", "Provides Course Outline (5)",
+        "Language Fluency (5)", "Preparation with Lesson Plan / Practicals (5)"
+    ),
+    "School Operations Evaluator": (
+        "Time Based Activity (5)", "Student Engagement Ideas (5)", "Pleasing Look (5)",
+        "Poised & Confident (5)", "Well Modulated Voice (5)"
+    )
+}
+
+# load_data always returns CSV_COLUMNS, so the per-role parameter columns can be resolved once at import.
+ROLE_PARAMS = {
+    role: tuple(p for p in params if p in CSV_COLUMNS)
+    for role, params in RELEVANT_PARAMS.items()
+}
+
 def hash_password(password: str) -> str:
-    try:
-        return hashlib.sha256(password.encode("utf-8")).hexdigest()
-    except Exception as e:
-        logger.error(f"Error hashing password: {str(e)}")
-        return ""
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
 
 def verify_password(password: str, stored_hash: str) -> bool:
     try:
-        return hash_password(password) == stored_hash
+        return hmac.compare_digest(hash_password(password), stored_hash)
     except Exception as e:
         logger.error(f"Error verifying password: {str(e)}")
         return False
 
+# Parsed CSVs are cached per file version; the mtime argument is part of the
+# cache key so a write to the file invalidates its entry on the next rerun.
+# Only the latest version of each file is requested, so whole-file caches keep a
+# handful of entries and per-trainer/per-filter caches are capped as well.
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _load_csv_cached(path: str, mtime: float) -> pd.DataFrame:
+    return pd.read_csv(path, engine="pyarrow")
+
+# EVALUATOR_INPUT.csv is only ever consumed with blanks filled in, so the
+# fillna pass is cached alongside the parse instead of rerunning per widget event.
+# Branch/Department are low-cardinality filter keys, so they are held as categoricals.
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _load_eval_inputs_cached(mtime: float) -> pd.DataFrame:
+    df = _load_csv_cached(DEFAULT_DATA_FILE, mtime).fillna("")
+    df = df.astype({col: "category" for col in ("Branch", "Department") if col in df.columns})
+    return df.set_index("Trainer ID", drop=False).rename_axis(None) if "Trainer ID" in df.columns else df
+
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _trainer_name_to_id_cached(mtime: float) -> dict:
+    df = _load_eval_inputs_cached(mtime).drop_duplicates("Trainer Name")
+    return dict(zip(df["Trainer Name"], df["Trainer ID"]))
+
+# Selectbox options only change with EVALUATOR_INPUT.csv (and the viewer's filters),
+# so the unique/sort work is cached instead of repeated on every rerun.
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _trainer_id_options(mtime: float) -> tuple:
+    return tuple(_load_eval_inputs_cached(mtime)["Trainer ID"].dropna().unique().tolist())
+
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def _trainer_name_options(mtime: float, branch: str, department: str, search_term: str) -> tuple:
+    trainers = _load_eval_inputs_cached(mtime)
+    if branch:
+        trainers = trainers[trainers["Branch"] == branch]
+    if department:
+        trainers = trainers[trainers["Department"] == department]
+    if search_term:
+        trainers = trainers[
+            trainers["Trainer Name"].str.contains(search_term, case=False, na=False, regex=False) |
+            trainers["Trainer ID"].str.contains(search_term, case=False, na=False, regex=False)
+        ]
+    # Leading "" is the selectbox's empty choice; a tuple is handed to the widget as-is.
+    return ("",) + tuple(sorted(trainers["Trainer Name"].unique().tolist()))
+
+def select_trainer_rows(df, trainer_id):
+    # Frames are indexed by Trainer ID, so this is a hash lookup rather than a column scan.
+    return df.loc[[trainer_id]] if trainer_id in df.index else df.iloc[:0]
+
+LATEX_ESCAPES = str.maketrans({
+    "\\": r"\textbackslash{}", "&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#",
+    "_": r"\_", "{": r"\{", "}": r"\}", "~": r"\textasciitilde{}", "^": r"\textasciicircum{}"
+})
+
+def latex_escape(text):
+    return str(text).translate(LATEX_ESCAPES)
+
+def latex_table_rows(df, columns):
+    # Builds the "a & b & c \\" body lines column-wise instead of formatting one row at a time.
+    # Cast to object before blanking NaN: fillna("") on a categorical column raises on pandas 2.
+    cells = df[columns].astype(object)
+    cells = cells.where(cells.notna(), "").astype(str).apply(lambda col: col.str.translate(LATEX_ESCAPES))
+    return "".join(cells[columns[0]].str.cat(cells[columns[1:]], sep=" & ", na_rep="") + " \\\\\n")
+
+# LaTeX report skeletons, filled with Template.substitute so the braces need no escaping.
+TRAINER_REPORT_TEMPLATE = Template(r"""
+\documentclass{article}
+\usepackage[utf8]{inputenc}
+\usepackage{geometry}
+\geometry{a4paper, margin=1in}
+\usepackage{longtable}
+\usepackage{booktabs}
+
+\begin{document}
+
+\section*{Trainer Assessment Report}
+\subsection*{Generated on: $generated}
+\subsection*{Trainer: $trainer_name (ID: $trainer_id)}
+
+\begin{longtable}{l l l l l l}
+\toprule
+Date of Assessment & TOTAL & AVERAGE & STATUS & LEVEL \#1 & LEVEL \#2 \\
+\midrule
+$rows
+\bottomrule
+\end{longtable}
+
+\end{document}
+""")
+
+ADMIN_REPORT_TEMPLATE = Template(r"""
+\documentclass{article}
+\usepackage[utf8]{inputenc}
+\usepackage{geometry}
+\geometry{a4paper, margin=1in}
+\usepackage{longtable}
+\usepackage{booktabs}
+
+\begin{document}
+
+\section*{Evaluator and Trainer Report}
+\subsection*{Generated on: $generated}
+\subsubsection*{Evaluators}
+\begin{longtable}{l l l l l}
+\toprule
+Username & Full Name & Email & Role & Created At \\
+\midrule
+$evaluator_rows
+\bottomrule
+\end{longtable}
+
+\subsubsection*{Trainers}
+\begin{longtable}{l l l l}
+\toprule
+Trainer ID & Trainer Name & Branch & Department \\
+\midrule
+$trainer_rows
+\bottomrule
+\end{longtable}
+
+\end{document}
+""")
+
+# Table bodies for whole-file exports, keyed on the source file and its version.
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _latex_rows_cached(path: str, mtime: float, columns: tuple, _df: pd.DataFrame) -> str:
+    return latex_table_rows(_df, list(columns))
+
+# Loaders return the file version they actually read alongside the frame; derived caches
+# must be keyed on that value, not on a fresh stat that may already see a newer file.
 def load_data():
     try:
         if not os.path.exists(CSV_FILE):
             if os.path.exists(DEFAULT_DATA_FILE):
-                df = pd.read_csv(DEFAULT_DATA_FILE)
+                df = _load_csv_cached(DEFAULT_DATA_FILE, os.path.getmtime(DEFAULT_DATA_FILE))
             else:
                 df = pd.DataFrame(columns=CSV_COLUMNS)
             df.to_csv(CSV_FILE, index=False)
+            mtime = os.path.getmtime(CSV_FILE)
         else:
-            df = pd.read_csv(CSV_FILE)
+            mtime = os.path.getmtime(CSV_FILE)
+            df = _load_csv_cached(CSV_FILE, mtime)
 
-        for col in CSV_COLUMNS:
-            if col not in df.columns:
-                df[col] = ""
-        return df[CSV_COLUMNS]
+        df = df.reindex(columns=CSV_COLUMNS, fill_value="").astype({"Evaluator Role": "category"})
+        return df.set_index("Trainer ID", drop=False).rename_axis(None), mtime
     except Exception as e:
         logger.error(f"Error loading data: {str(e)}")
         st.error("Failed to load assessment data. Please try again later.")
-        return pd.DataFrame(columns=CSV_COLUMNS)
+        return pd.DataFrame(columns=CSV_COLUMNS), 0.0
+
+def load_eval_inputs():
+    # Single entry point for EVALUATOR_INPUT.csv so one rerun never parses it twice.
+    if not os.path.exists(DEFAULT_DATA_FILE):
+        return pd.DataFrame(columns=["Trainer ID", "Trainer Name", "Department", "Branch"]), 0.0
+    mtime = os.path.getmtime(DEFAULT_DATA_FILE)
+    return _load_eval_inputs_cached(mtime), mtime
+
+# The next free ID only moves when a trainer is appended to EVALUATOR_INPUT.csv.
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _next_trainer_id_cached(mtime: float) -> str:
+    eval_inputs_df = _load_eval_inputs_cached(mtime)
+    if "Trainer ID" not in eval_inputs_df.columns:
+        return "TR001"
+    existing_ids = eval_inputs_df["Trainer ID"].dropna().astype(str)
+    numbers = pd.to_numeric(existing_ids.str.extract(r"^TR00(\d+)$", expand=False), errors="coerce")
+    next_number = int(numbers.max()) + 1 if numbers.notna().any() else 1
+    return f"TR00{next_number}"
 
 def generate_new_trainer_id():
     try:
         if os.path.exists(DEFAULT_DATA_FILE):
-            df = pd.read_csv(DEFAULT_DATA_FILE)
-            if "Trainer ID" in df.columns:
-                existing_ids = df["Trainer ID"].dropna().astype(str)
-                numbers = []
-                for tid in existing_ids:
-                    if tid.startswith("TR00"):
-                        num_part = tid.replace("TR00", "")
-                        if num_part.isdigit():
-                            numbers.append(int(num_part))
-                next_number = max(numbers) + 1 if numbers else 1
-                return f"TR00{next_number}"
+            return _next_trainer_id_cached(os.path.getmtime(DEFAULT_DATA_FILE))
     except Exception as e:
         logger.error(f"Trainer ID generation failed: {str(e)}")
         st.warning("Failed to generate Trainer ID. Using default ID.")
     return "TR001"
 
+def append_csv_row(path, row):
+    # Appends only the new row when the file's header already covers it;
+    # otherwise the file is rewritten once so later appends can take the fast path.
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        pd.DataFrame([row]).to_csv(path, index=False)
+    else:
+        with open(path, newline="") as f:
+            header = next(csv.reader(f), [])
+        if set(row).issubset(header):
+            with open(path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) not in (b"\n", b"\r")
+            with open(path, "a", newline="") as f:
+                if needs_newline:
+                    f.write("\n")
+                csv.DictWriter(f, fieldnames=header, restval="", lineterminator="\n").writerow(row)
+        else:
+            df = pd.read_csv(path)
+            pd.concat([df, pd.DataFrame([row])], ignore_index=True).to_csv(path, index=False)
+    _load_csv_cached.clear()
+    _load_eval_inputs_cached.clear()
+    _next_trainer_id_cached.clear()
+
 def save_new_trainer_to_input(trainer_id, trainer_name, department):
     try:
-        if os.path.exists(DEFAULT_DATA_FILE):
-            df = pd.read_csv(DEFAULT_DATA_FILE)
-        else:
-            df = pd.DataFrame(columns=["Trainer ID", "Trainer Name", "Department", "Branch"])
-        
-        if "Trainer ID" not in df.columns:
-            df["Trainer ID"] = ""
-        if "Trainer Name" not in df.columns:
-            df["Trainer Name"] = ""
-        if "Department" not in df.columns:
-            df["Department"] = ""
-        if "Branch" not in df.columns:
-            df["Branch"] = ""
-            
         new_entry = {
             "Trainer ID": trainer_id,
             "Trainer Name": trainer_name,
             "Department": department,
             "Branch": ""
         }
-        df = pd.concat([df, pd.DataFrame([new_entry])], ignore_index=True)
-        df.to_csv(DEFAULT_DATA_FILE, index=False)
-        return df
+        append_csv_row(DEFAULT_DATA_FILE, new_entry)
     except Exception as e:
         logger.error(f"Error saving new trainer: {str(e)}")
         st.error("Failed to save new trainer information.")
-        return pd.DataFrame(columns=["Trainer ID", "Trainer Name", "Department", "Branch"])
 
 def send_email_reminder(email):
     try:
@@ -125,57 +307,84 @@ def send_email_reminder(email):
         logger.error(f"Error sending email reminder: {str(e)}")
         st.error("Failed to send reminder email.")
 
+# Only the current store version is ever read, so a couple of entries is enough.
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _load_parquet_cached(path: str, mtime: float) -> pd.DataFrame:
+    return pd.read_parquet(path)
+
 def load_evaluators():
     try:
         if not os.path.exists(EVALUATOR_STORE):
-            df = pd.DataFrame(columns=EVALUATOR_COLUMNS)
-            df.to_csv(EVALUATOR_STORE, index=False)
+            # One-time migration from the legacy CSV store.
+            if os.path.exists(LEGACY_EVALUATOR_STORE):
+                df = pd.read_csv(LEGACY_EVALUATOR_STORE)
+            else:
+                df = pd.DataFrame(columns=EVALUATOR_COLUMNS)
+            save_evaluators(df.reindex(columns=EVALUATOR_COLUMNS, fill_value=""))
+            mtime = os.path.getmtime(EVALUATOR_STORE)
         else:
-            df = pd.read_csv(EVALUATOR_STORE)
-        for col in EVALUATOR_COLUMNS:
-            if col not in df.columns:
-                df[col] = ""
-        return df[EVALUATOR_COLUMNS].copy()
+            mtime = os.path.getmtime(EVALUATOR_STORE)
+            df = _load_parquet_cached(EVALUATOR_STORE, mtime)
+        # Indexed by username so admin lookups, edits and deletes are label-based; the index is not persisted.
+        df = df.reindex(columns=EVALUATOR_COLUMNS, fill_value="")
+        return df.set_index("username", drop=False).rename_axis(None), mtime
     except Exception as e:
         logger.error(f"Error loading evaluators: {str(e)}")
         st.error("Failed to load evaluator data.")
-        return pd.DataFrame(columns=EVALUATOR_COLUMNS)
+        return pd.DataFrame(columns=EVALUATOR_COLUMNS), 0.0
+
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _evaluator_options(mtime: float, _evaluators_df: pd.DataFrame) -> tuple:
+    return ("",) + tuple(_evaluators_df.index.tolist())
 
 def save_evaluators(df):
     try:
-        df.to_csv(EVALUATOR_STORE, index=False)
+        # Every evaluator field is text; normalising here keeps the Parquet schema stable across saves.
+        # Written to a temp file and swapped in, so a concurrent reader never sees a half-written store.
+        tmp_path = f"{EVALUATOR_STORE}.tmp"
+        df.fillna("").astype(str).to_parquet(tmp_path, index=False, compression="zstd")
+        os.replace(tmp_path, EVALUATOR_STORE)
+        _load_parquet_cached.clear()
     except Exception as e:
         logger.error(f"Error saving evaluators: {str(e)}")
         st.error("Failed to save evaluator data.")
 
-def evaluator_section(df_main):
+# Level status only changes when assessment_data.csv does, so it is cached per
+# trainer and file version rather than recomputed on every keystroke in the form.
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def compute_level_state(trainer_id: str, mtime: float, _past_assessments: pd.DataFrame) -> tuple:
+    level_status = {}
+    submissions = {}
+    # Match role names once per category, then compare the integer codes per row.
+    roles = _past_assessments["Evaluator Role"].astype("category")
+    categories = roles.cat.categories.astype(str).str.lower()
+    codes = roles.cat.codes.to_numpy()
+    is_tech = np.isin(codes, np.flatnonzero(categories.str.contains("technical", regex=False)))
+    is_ops = np.isin(codes, np.flatnonzero(categories.str.contains("school", regex=False)))
+    for level in LEVELS:
+        qualified = _past_assessments[level].eq("QUALIFIED").to_numpy()
+        if (qualified & is_tech).any() and (qualified & is_ops).any():
+            level_status[level] = "QUALIFIED"
+        else:
+            level_status[level] = "NOT QUALIFIED"
+        submissions[f"{level}_submissions"] = int(_past_assessments.loc[qualified, "Evaluator Username"].nunique(dropna=False))
+    return level_status, submissions
+
+def evaluator_section(df_main, data_version):
     try:
         st.subheader("🧑‍🏫 Evaluator Dashboard")
 
-        if "logged_in" not in st.session_state or not st.session_state.get("logged_in"):
+        if not st.session_state.get("logged_in"):
             st.warning("Please login to access the evaluator panel.")
             return
 
-        df = df_main.copy()
-        if "Trainer ID" not in df.columns:
+        if "Trainer ID" not in df_main.columns:
             st.error("❌ 'Trainer ID' column missing in data.")
             return
 
         evaluator_role = st.selectbox("Select Evaluator Role", ["Technical Evaluator", "School Operations Evaluator"], key="evaluator_role")
         evaluator_username = st.session_state.get("logged_user", "")
 
-        relevant_params = {
-            "Technical Evaluator": [
-                "Has Knowledge of STEM (5)", "Ability to integrate STEM With related activities (10)",
-                "Discusses Up-to-date information related to STEM (5)", "Provides Course Outline (5)",
-                "Language Fluency (5)", "Preparation with Lesson Plan / Practicals (5)"
-            ],
-            "School Operations Evaluator": [
-                "Time Based Activity (5)", "Student Engagement Ideas (5)", "Pleasing Look (5)",
-                "Poised & Confident (5)", "Well Modulated Voice (5)"
-            ]
-        }
-
         mode = st.radio("Select Trainer ID Mode", ["Enter Existing Trainer ID", "New Trainer Creation ID"])
         trainer_id = ""
         trainer_name = ""
@@ -185,16 +394,16 @@ def evaluator_section(df_main):
         if mode.startswith("Enter"):
             try:
                 if os.path.exists(DEFAULT_DATA_FILE):
-                    eval_inputs_df = pd.read_csv(DEFAULT_DATA_FILE).fillna("")
+                    eval_inputs_df, inputs_version = load_eval_inputs()
                     if "Trainer ID" not in eval_inputs_df.columns:
                         st.error("❌ 'Trainer ID' column missing in EVALUATOR_INPUT.csv.")
                         return
-                    available_ids = eval_inputs_df["Trainer ID"].dropna().unique().tolist()
+                    available_ids = _trainer_id_options(inputs_version)
                     if not available_ids:
                         st.warning("No Trainer IDs found in EVALUATOR_INPUT.csv.")
                         return
                     selected_id = st.selectbox("Select Existing Trainer ID", available_ids)
-                    trainer_data = eval_inputs_df[eval_inputs_df["Trainer ID"] == selected_id].iloc[0].to_dict()
+                    trainer_data = select_trainer_rows(eval_inputs_df, selected_id).iloc[0].to_dict()
                     trainer_id = trainer_data.get("Trainer ID", "")
                     trainer_name = trainer_data.get("Trainer Name", "")
                     department = trainer_data.get("Department", "")
@@ -230,130 +439,135 @@ def evaluator_section(df_main):
                 else:
                     st.warning("Please enter Trainer Name, Department, and Email to auto-generate Trainer ID.")
 
-        past_assessments = df[df["Trainer ID"] == trainer_id] if trainer_id else pd.DataFrame()
+        past_assessments = select_trainer_rows(df_main, trainer_id)
         if not past_assessments.empty:
             st.markdown("### 🔁 Previous Assessments")
-            st.dataframe(past_assessments, use_container_width=True)
+            st.dataframe(past_assessments, use_container_width=True, hide_index=True)
 
-        levels = ["LEVEL #1", "LEVEL #2", "LEVEL #3"]
         level_status = {}
         submissions = {}
         assessment_data = {}
 
         try:
-            for level in levels:
-                level_rows = past_assessments[past_assessments[level] == "QUALIFIED"]
-                evaluators = level_rows["Evaluator Username"].tolist()
-                has_tech = any("technical" in s.lower() for s in level_rows["Evaluator Role"].fillna(""))
-                has_ops = any("school" in s.lower() for s in level_rows["Evaluator Role"].fillna(""))
-                if has_tech and has_ops:
-                    level_status[level] = "QUALIFIED"
-                else:
-                    level_status[level] = "NOT QUALIFIED"
-                submissions[f"{level}_submissions"] = len(set(evaluators))
+            level_status, submissions = compute_level_state(trainer_id, data_version, past_assessments)
         except Exception as e:
             logger.error(f"Error processing level statuses: {str(e)}")
             st.error("Failed to process assessment levels.")
 
-        for level in levels:
-            with st.expander(f"🔹 {level} Assessment"):
+        # Prefill values come from the trainer's first recorded row; converted once rather than per widget.
+        last_row = past_assessments.iloc[0].to_dict() if not past_assessments.empty else {}
+        part_params = ROLE_PARAMS[evaluator_role]
+
+        # All level inputs and the submit button share one form, so typing does not rerun the
+        # page per keystroke and Submit always sees exactly what is on screen.
+        with st.form(f"evaluation_form_{trainer_id}"):
+            for level in LEVELS:
+                with st.expander(f"🔹 {level} Assessment"):
+                    try:
+                        if level_status.get(level) == "QUALIFIED" and submissions.get(f"{level}_submissions", 0) >= 2:
+                            st.write(f"{level} already qualified by both evaluators.")
+                        elif level_status.get(level) == "QUALIFIED" and submissions.get(f"{level}_submissions", 0) == 1:
+                            st.write(f"{level} qualified by one evaluator. Awaiting second evaluation.")
+                        else:
+                            if level == "LEVEL #1" or (level == "LEVEL #2" and level_status.get("LEVEL #1") == "QUALIFIED") or \
+                               (level == "LEVEL #3" and level_status.get("LEVEL #2") == "QUALIFIED"):
+                                part = {}
+                                for k in part_params:
+                                    value = last_row.get(k, "")
+                                    part[k] = st.text_input(k, value=value, key=f"{k}_{level}_{trainer_id}")
+                                level_status_key = f"{level}_status_{evaluator_role}"
+                                status = st.selectbox(f"{level} Status", ["QUALIFIED", "NOT QUALIFIED"], key=level_status_key)
+                                manager_referral = ""
+                                if level == "LEVEL #3":
+                                    manager_referral = st.text_input("Manager Referral (Required for Level 3)", key=f"manager_referral_{level}_{trainer_id}")
+
+                                # Per-level assessment inputs
+                                total = st.number_input("TOTAL", min_value=0, max_value=100, step=1, key=f"total_{level}_{trainer_id}")
+                                avg = st.number_input("AVERAGE", min_value=0.0, max_value=100.0, step=0.1, key=f"avg_{level}_{trainer_id}")
+                                status_overall = st.selectbox("STATUS", ["CLEARED", "REDO"], key=f"status_{level}_{trainer_id}")
+                                reminder = st.text_area("Reminder", key=f"reminder_{level}_{trainer_id}")
+                                reminder_email = st.text_input("Evaluator Email for Reminder", key=f"reminder_email_{level}_{trainer_id}")
+
+                                assessment_data[level] = {
+                                    "params": part,
+                                    "level_status": status,
+                                    "manager_referral": manager_referral if level == "LEVEL #3" else "",
+                                    "total": total,
+                                    "average": avg,
+                                    "status_overall": status_overall,
+                                    "reminder": reminder,
+                                    "reminder_email": reminder_email,
+                                    "score_status": "Score Cards has not been sent"
+                                }
+                    except Exception as e:
+                        logger.error(f"Error in {level} assessment: {str(e)}")
+                        st.error(f"Failed to process {level} assessment.")
+            submitted = st.form_submit_button("💾 Submit Evaluation")
+
+        # Score card controls use st.button, which is not allowed inside a form.
+        for level, data in assessment_data.items():
+            with st.expander(f"📨 {level} Score Card"):
                 try:
-                    if level_status.get(level) == "QUALIFIED" and submissions.get(f"{level}_submissions", 0) >= 2:
-                        st.write(f"{level} already qualified by both evaluators.")
-                    elif level_status.get(level) == "QUALIFIED" and submissions.get(f"{level}_submissions", 0) == 1:
-                        st.write(f"{level} qualified by one evaluator. Awaiting second evaluation.")
-                    else:
-                        if level == "LEVEL #1" or (level == "LEVEL #2" and level_status.get("LEVEL #1") == "QUALIFIED") or \
-                           (level == "LEVEL #3" and level_status.get("LEVEL #2") == "QUALIFIED"):
-                            part_params = [p for p in relevant_params[evaluator_role] if any(p in col for col in df.columns)]
-                            part = {}
-                            for k in part_params:
-                                value = past_assessments[k].iloc[0] if not past_assessments.empty and k in past_assessments.columns else ""
-                                part[k] = st.text_input(k, value=value, key=f"{k}_{level}_{trainer_id}")
-                            level_status_key = f"{level}_status_{evaluator_role}"
-                            status = st.selectbox(f"{level} Status", ["QUALIFIED", "NOT QUALIFIED"], key=level_status_key)
-                            manager_referral = ""
-                            if level == "LEVEL #3":
-                                manager_referral = st.text_input("Manager Referral (Required for Level 3)", key=f"manager_referral_{level}_{trainer_id}")
-                            
-                            # Per-level assessment inputs
-                            total = st.number_input("TOTAL", min_value=0, max_value=100, step=1, key=f"total_{level}_{trainer_id}")
-                            avg = st.number_input("AVERAGE", min_value=0.0, max_value=100.0, step=0.1, key=f"avg_{level}_{trainer_id}")
-                            status_overall = st.selectbox("STATUS", ["CLEARED", "REDO"], key=f"status_{level}_{trainer_id}")
-                            reminder = st.text_area("Reminder", key=f"reminder_{level}_{trainer_id}")
-                            reminder_email = st.text_input("Evaluator Email for Reminder", key=f"reminder_email_{level}_{trainer_id}")
-                            if reminder_email:
-                                send_email_reminder(reminder_email)
-
-                            # Send Score Card button for this level
-                            send_report_enabled = level_status.get(level) == "QUALIFIED" and submissions.get(f"{level}_submissions", 0) >= 2
-                            score_status = st.selectbox(
-                                "Status of Score Card",
-                                ["Score Cards has not been sent"] if not send_report_enabled else ["Score Cards has been sent", "Score Cards has not been sent"],
-                                key=f"score_status_{level}_{trainer_id}",
-                                help="Select the status of the score card. 'Score Cards has not been sent' enables sending."
-                            )
-                            send_score_card_disabled = score_status != "Score Cards has not been sent"
-                            if st.button("SEND SCORE CARD", disabled=send_score_card_disabled, key=f"send_score_card_{level}_{trainer_id}"):
-                                try:
-                                    if not trainer_email or '@' not in trainer_email:
-                                        st.error("No valid trainer email found. Please ensure the trainer's email is provided in EVALUATOR_INPUT.csv or during new trainer creation.")
-                                    else:
-                                        email_body = f"Score Card for Trainer ID: {trainer_id}\n"
-                                        email_body += f"Trainer Name: {trainer_name}\n"
-                                        email_body += f"Department: {department}\n"
-                                        email_body += f"Date of Assessment: {datetime.today().date()}\n"
-                                        email_body += f"Evaluator: {evaluator_username} ({evaluator_role})\n"
-                                        email_body += f"\nAssessment Details for {level}:\n"
-                                        for param in part_params:
-                                            email_body += f"{param}: {part.get(param, 'N/A')}\n"
-                                        email_body += f"{level} Status: {status}\n"
-                                        email_body += f"TOTAL: {total}\nAVERAGE: {avg}\nSTATUS: {status_overall}\n"
-                                        if manager_referral and level == "LEVEL #3":
-                                            email_body += f"Manager Referral: {manager_referral}\n"
-                                        email_body += f"Reminder: {reminder or 'None'}"
-                                        email_subject = f"Score Card for Trainer {trainer_id} - {level} - {datetime.today().date()}"
-                                        mailto_link = f"mailto:{urllib.parse.quote(trainer_email)}?subject={urllib.parse.quote(email_subject)}&body={urllib.parse.quote(email_body)}"
-                                        st.markdown(f'<a href="{mailto_link}" target="_blank">Open Email Client</a>', unsafe_allow_html=True)
-                                        st.success(f"Score card email prepared for Trainer ID: {trainer_id} to {trainer_email} for {level}")
-                                        score_status = "Score Cards has been sent"
-                                        st.session_state[f"score_status_{level}_{trainer_id}"] = score_status
-                                except Exception as e:
-                                    logger.error(f"Error sending score card for {level}: {str(e)}")
-                                    st.error(f"Failed to prepare score card email for {level}.")
-
-                            assessment_data[level] = {
-                                "params": part,
-                                "level_status": status,
-                                "manager_referral": manager_referral if level == "LEVEL #3" else "",
-                                "total": total,
-                                "average": avg,
-                                "status_overall": status_overall,
-                                "reminder": reminder,
-                                "score_status": score_status
-                            }
+                    if data["reminder_email"]:
+                        send_email_reminder(data["reminder_email"])
+
+                    send_report_enabled = level_status.get(level) == "QUALIFIED" and submissions.get(f"{level}_submissions", 0) >= 2
+                    score_status = st.selectbox(
+                        "Status of Score Card",
+                        ["Score Cards has not been sent"] if not send_report_enabled else ["Score Cards has been sent", "Score Cards has not been sent"],
+                        key=f"score_status_{level}_{trainer_id}",
+                        help="Select the status of the score card. 'Score Cards has not been sent' enables sending."
+                    )
+                    send_score_card_disabled = score_status != "Score Cards has not been sent"
+                    if st.button("SEND SCORE CARD", disabled=send_score_card_disabled, key=f"send_score_card_{level}_{trainer_id}"):
+                        if not trainer_email or '@' not in trainer_email:
+                            st.error("No valid trainer email found. Please ensure the trainer's email is provided in EVALUATOR_INPUT.csv or during new trainer creation.")
+                        else:
+                            today = datetime.today().date()
+                            email_body = f"Score Card for Trainer ID: {trainer_id}\n"
+                            email_body += f"Trainer Name: {trainer_name}\n"
+                            email_body += f"Department: {department}\n"
+                            email_body += f"Date of Assessment: {today}\n"
+                            email_body += f"Evaluator: {evaluator_username} ({evaluator_role})\n"
+                            email_body += f"\nAssessment Details for {level}:\n"
+                            for param in part_params:
+                                email_body += f"{param}: {data['params'].get(param, 'N/A')}\n"
+                            email_body += f"{level} Status: {data['level_status']}\n"
+                            email_body += f"TOTAL: {data['total']}\nAVERAGE: {data['average']}\nSTATUS: {data['status_overall']}\n"
+                            if data["manager_referral"] and level == "LEVEL #3":
+                                email_body += f"Manager Referral: {data['manager_referral']}\n"
+                            email_body += f"Reminder: {data['reminder'] or 'None'}"
+                            email_subject = f"Score Card for Trainer {trainer_id} - {level} - {today}"
+                            import urllib.parse
+                            mailto_link = f"mailto:{urllib.parse.quote(trainer_email)}?subject={urllib.parse.quote(email_subject)}&body={urllib.parse.quote(email_body)}"
+                            st.markdown(f'<a href="{mailto_link}" target="_blank">Open Email Client</a>', unsafe_allow_html=True)
+                            st.success(f"Score card email prepared for Trainer ID: {trainer_id} to {trainer_email} for {level}")
+                            score_status = "Score Cards has been sent"
+                            st.session_state[f"score_status_{level}_{trainer_id}"] = score_status
+                    data["score_status"] = score_status
                 except Exception as e:
-                    logger.error(f"Error in {level} assessment: {str(e)}")
-                    st.error(f"Failed to process {level} assessment.")
+                    logger.error(f"Error sending score card for {level}: {str(e)}")
+                    st.error(f"Failed to prepare score card email for {level}.")
 
-        if st.button("💾 Submit Evaluation", key="submit_evaluation"):
+        if submitted:
             try:
                 if not trainer_id:
                     st.error("❌ Trainer ID is required.")
                     return
 
+                today = datetime.today().date()
                 entry = {
                     "Trainer ID": trainer_id,
                     "Trainer Name": trainer_name or "New",
                     "Department": department or "",
-                    "DOJ": datetime.today().date(),
+                    "DOJ": today,
                     "Branch": "", "Discipline": "", "Course": "",
-                    "Date of assessment": datetime.today().date(),
+                    "Date of assessment": today,
                     "Evaluator Username": evaluator_username,
                     "Evaluator Role": evaluator_role,
                 }
 
-                for level in levels:
+                for level in LEVELS:
                     if level_status.get(level) != "QUALIFIED" or submissions.get(f"{level}_submissions", 0) < 2:
                         data = assessment_data.get(level, {})
                         for param in data.get("params", {}):
@@ -385,8 +599,8 @@ def evaluator_section(df_main):
                         entry["LEVEL #3"] = "NOT QUALIFIED"
                         st.warning("Level 3 requires 5 courses with 90% average + Manager Referral.")
 
-                updated_df = pd.concat([df_main, pd.DataFrame([entry])], ignore_index=True)
-                updated_df.to_csv(CSV_FILE, index=False)
+                append_csv_row(CSV_FILE, {col: entry.get(col, "") for col in CSV_COLUMNS})
+                compute_level_state.clear()
                 st.success(f"✅ Assessment Saved for Trainer ID: {trainer_id}")
             except Exception as e:
                 logger.error(f"Error submitting evaluation: {str(e)}")
@@ -394,9 +608,8 @@ def evaluator_section(df_main):
 
         if st.button("Logout", key="evaluator_logout"):
             try:
-                for key in ["logged_in", "role", "logged_user"]:
-                    if key in st.session_state:
-                        del st.session_state[key]
+                for key in ("logged_in", "role", "logged_user"):
+                    st.session_state.pop(key, None)
                 st.success("Logged out successfully!")
                 st.rerun()
             except Exception as e:
@@ -406,11 +619,29 @@ def evaluator_section(df_main):
         logger.error(f"Error in evaluator section: {str(e)}")
         st.error("An unexpected error occurred in the Evaluator Dashboard.")
 
-def viewer_section(df_main):
+# Serialised per trainer and assessment-file version, so reruns reuse the bytes.
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def _trainer_report_csv_cached(trainer_id: str, mtime: float, _trainer_report: pd.DataFrame) -> bytes:
+    return _trainer_report.to_csv(index=False).encode("utf-8")
+
+# Lower-cased "ID<US>Name" column so the admin filter is a single pass.
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _trainer_search_column(mtime: float, _df: pd.DataFrame) -> pd.Series:
+    return (_df["Trainer ID"].astype(str) + "\x1f" + _df["Trainer Name"].astype(str)).str.lower()
+
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def _filtered_trainer_options(trainer_filter: str, mtime: float, _filtered: pd.DataFrame) -> tuple:
+    return ("",) + tuple(sorted(_filtered["Trainer ID"].dropna().unique().tolist()))
+
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def _filtered_reports_csv_cached(trainer_filter: str, mtime: float, _filtered: pd.DataFrame) -> bytes:
+    return _filtered.to_csv(index=False).encode("utf-8")
+
+def viewer_section(df_main, data_version):
     try:
         st.subheader("📊 Viewer Dashboard")
 
-        if "logged_in" not in st.session_state or not st.session_state.get("logged_in"):
+        if not st.session_state.get("logged_in"):
             st.warning("Please login to access the viewer dashboard.")
             return
 
@@ -421,25 +652,16 @@ def viewer_section(df_main):
 
         if os.path.exists(DEFAULT_DATA_FILE):
             try:
-                eval_inputs_df = pd.read_csv(DEFAULT_DATA_FILE).fillna("")
+                eval_inputs_df, inputs_version = load_eval_inputs()
                 if "Trainer ID" not in eval_inputs_df.columns or "Trainer Name" not in eval_inputs_df.columns or "Branch" not in eval_inputs_df.columns or "Department" not in eval_inputs_df.columns:
                     st.error("❌ Required columns missing in EVALUATOR_INPUT.csv.")
                     return
-                filtered_trainers = eval_inputs_df.copy()
-                if branch:
-                    filtered_trainers = filtered_trainers[filtered_trainers["Branch"] == branch]
-                if department:
-                    filtered_trainers = filtered_trainers[filtered_trainers["Department"] == department]
-                if search_term:
-                    filtered_trainers = filtered_trainers[
-                        filtered_trainers["Trainer Name"].str.contains(search_term, case=False, na=False) |
-                        filtered_trainers["Trainer ID"].str.contains(search_term, case=False, na=False)
-                    ]
-                if filtered_trainers.empty:
+                trainer_names = _trainer_name_options(inputs_version, branch, department, search_term)
+                if len(trainer_names) == 1:
                     st.warning("No trainers match the selected filters.")
                     trainer_name = ""
                 else:
-                    trainer_name = st.selectbox("Select Trainer Name", options=[""] + sorted(filtered_trainers["Trainer Name"].unique().tolist()), key="viewer_trainer")
+                    trainer_name = st.selectbox("Select Trainer Name", options=trainer_names, key="viewer_trainer")
             except Exception as e:
                 logger.error(f"Error filtering trainers: {str(e)}")
                 st.error("Failed to load trainer data.")
@@ -448,14 +670,13 @@ def viewer_section(df_main):
             st.error("EVALUATOR_INPUT.csv not found.")
             return
 
-        df = df_main.copy()
         if trainer_name and os.path.exists(CSV_FILE):
             try:
-                trainer_id = eval_inputs_df[eval_inputs_df["Trainer Name"] == trainer_name]["Trainer ID"].iloc[0]
-                trainer_report = df[df["Trainer ID"] == trainer_id]
+                trainer_id = _trainer_name_to_id_cached(inputs_version).get(trainer_name, "")
+                trainer_report = select_trainer_rows(df_main, trainer_id)
                 if not trainer_report.empty:
                     st.markdown("### 📋 Assessment Records")
-                    st.dataframe(trainer_report, use_container_width=True)
+                    st.dataframe(trainer_report, use_container_width=True, hide_index=True)
                     st.markdown(f"**Trainer ID:** {trainer_id} | **Name:** {trainer_name} | **Department:** {department or 'N/A'} | **Branch:** {branch or 'N/A'}")
                 else:
                     st.warning("No assessment records found for the selected trainer.")
@@ -466,63 +687,43 @@ def viewer_section(df_main):
         if trainer_name and not trainer_report.empty:
             col1, col2 = st.columns(2)
             with col1:
-                if st.button("📥 Download Trainer Data as CSV", key="download_csv"):
-                    try:
-                        csv = trainer_report.to_csv(index=False)
-                        b64 = base64.b64encode(csv.encode()).decode()
-                        href = f'<a href="data:file/csv;base64,{b64}" download="trainer_{trainer_id}_assessment.csv">Download CSV File</a>'
-                        st.markdown(href, unsafe_allow_html=True)
-                    except Exception as e:
-                        logger.error(f"Error downloading CSV: {str(e)}")
-                        st.error("Failed to download CSV file.")
+                try:
+                    st.download_button(
+                        label="📥 Download Trainer Data as CSV",
+                        data=_trainer_report_csv_cached(trainer_id, data_version, trainer_report),
+                        file_name=f"trainer_{trainer_id}_assessment.csv",
+                        mime="text/csv",
+                        key="download_csv"
+                    )
+                except Exception as e:
+                    logger.error(f"Error downloading CSV: {str(e)}")
+                    st.error("Failed to download CSV file.")
             with col2:
-                if st.button("📄 Download Trainer Data as PDF", key="download_pdf"):
+                if st.button("📄 Prepare Trainer Report (LaTeX)", key="download_pdf"):
                     try:
-                        latex_content = r"""
-                        \documentclass{article}
-                        \usepackage[utf8]{inputenc}
-                        \usepackage{geometry}
-                        \geometry{a4paper, margin=1in}
-                        \usepackage{longtable}
-                        \usepackage{booktabs}
-                        
-                        \begin{document}
-                        
-                        \section*{Trainer Assessment Report}
-                        \subsection*{Generated on: """ + datetime.now().strftime("%d-%m-%Y %I:%M %p IST") + r"""}
-                        \subsection*{Trainer: """ + trainer_name + r""" (ID: """ + trainer_id + r""")}
-                        
-                        \begin{longtable}{l l l l l l}
-                        \toprule
-                        Date of Assessment & TOTAL & AVERAGE & STATUS & LEVEL \#1 & LEVEL \#2 \\
-                        \midrule
-                        """ + "".join([f"{row['Date of assessment']} & {row['TOTAL']} & {row['AVERAGE']} & {row['STATUS']} & {row['LEVEL #1']} & {row['LEVEL #2']} \\\\\n" for _, row in trainer_report.iterrows()]) + r"""
-                        \bottomrule
-                        \end{longtable}
-                        
-                        \end{document}
-                        """
-                        with open("trainer_report.tex", "w") as f:
-                            f.write(latex_content)
-                        with open("trainer_report.tex", "rb") as f:
-                            pdf_data = f.read()
+                        latex_content = TRAINER_REPORT_TEMPLATE.substitute(
+                            generated=datetime.now().strftime("%d-%m-%Y %I:%M %p IST"),
+                            trainer_name=latex_escape(trainer_name),
+                            trainer_id=latex_escape(trainer_id),
+                            rows=latex_table_rows(trainer_report, ["Date of assessment", "TOTAL", "AVERAGE", "STATUS", "LEVEL #1", "LEVEL #2"])
+                        )
                         st.download_button(
-                            label="Download Trainer Data as PDF",
-                            data=pdf_data,
-                            file_name=f"trainer_{trainer_id}_assessment.pdf",
-                            mime="application/x-latex"
+                            label="Download LaTeX Report",
+                            data=latex_content.encode("utf-8"),
+                            file_name=f"trainer_{trainer_id}_assessment.tex",
+                            mime="application/x-tex"
                         )
-                        st.success("PDF download initiated.")
+                        st.success("LaTeX report ready for download.")
                     except Exception as e:
-                        logger.error(f"Error generating PDF: {str(e)}")
-                        st.error("Failed to generate PDF report.")
+                        logger.error(f"Error generating LaTeX report: {str(e)}")
+                        st.error("Failed to generate LaTeX report.")
 
         if st.button("View All Trainers", key="view_all_trainers"):
             try:
                 if os.path.exists(DEFAULT_DATA_FILE):
                     all_trainers = eval_inputs_df[["Trainer ID", "Trainer Name", "Department", "Branch"]].drop_duplicates()
                     st.markdown("### 🆔 All Trainers")
-                    st.dataframe(all_trainers, use_container_width=True)
+                    st.dataframe(all_trainers, use_container_width=True, hide_index=True)
                 else:
                     st.error("EVALUATOR_INPUT.csv not found.")
             except Exception as e:
@@ -531,9 +732,8 @@ def viewer_section(df_main):
 
         if st.button("Logout", key="viewer_logout"):
             try:
-                for key in ["logged_in", "role", "logged_user"]:
-                    if key in st.session_state:
-                        del st.session_state[key]
+                for key in ("logged_in", "role", "logged_user"):
+                    st.session_state.pop(key, None)
                 st.success("Logged out successfully!")
                 st.rerun()
             except Exception as e:
@@ -543,11 +743,57 @@ def viewer_section(df_main):
         logger.error(f"Error in viewer section: {str(e)}")
         st.error("An unexpected error occurred in the Viewer Dashboard.")
 
-def admin_section(df_main):
+# Runs as a fragment so preparing the LaTeX export or clicking a download only reruns this row.
+@st.fragment
+def _admin_report_downloads(selected_trainer, trainer_filter, trainer_reports, filtered, data_version):
+    try:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.download_button(
+                label="Download Trainer Report CSV",
+                data=_trainer_report_csv_cached(selected_trainer, data_version, trainer_reports),
+                file_name=f"trainer_{selected_trainer}_reports.csv"
+            )
+        with col2:
+            st.download_button(
+                label="Download All Filtered Reports CSV",
+                data=_filtered_reports_csv_cached(trainer_filter, data_version, filtered),
+                file_name="filtered_trainer_reports.csv"
+            )
+        with col3:
+            if st.button("Prepare Evaluators/Trainers Report (LaTeX)"):
+                try:
+                    evaluators_df, eval_version = load_evaluators()
+                    eval_inputs_df, inputs_version = load_eval_inputs()
+                    latex_content = ADMIN_REPORT_TEMPLATE.substitute(
+                        generated=datetime.now().strftime("%d-%m-%Y %I:%M %p IST"),
+                        evaluator_rows=_latex_rows_cached(
+                            EVALUATOR_STORE, eval_version,
+                            ("username", "full_name", "email", "role", "created_at"), evaluators_df
+                        ),
+                        trainer_rows=_latex_rows_cached(
+                            DEFAULT_DATA_FILE, inputs_version,
+                            ("Trainer ID", "Trainer Name", "Branch", "Department"), eval_inputs_df
+                        )
+                    )
+                    st.download_button(
+                        label="Download LaTeX Report",
+                        data=latex_content.encode("utf-8"),
+                        file_name="evaluators_trainers_report.tex",
+                        mime="application/x-tex"
+                    )
+                except Exception as e:
+                    logger.error(f"Error generating LaTeX report: {str(e)}")
+                    st.error("Failed to generate LaTeX report.")
+    except Exception as e:
+        logger.error(f"Error in admin report downloads: {str(e)}")
+        st.error("Failed to prepare report downloads.")
+
+def admin_section(df_main, data_version):
     try:
         st.subheader("👨‍💼 Super Administrator Section")
 
-        if "logged_in" not in st.session_state or not st.session_state.get("logged_in"):
+        if not st.session_state.get("logged_in"):
             st.warning("Please login to access the admin panel.")
             return
 
@@ -562,7 +808,9 @@ def admin_section(df_main):
             st.session_state.admin_section = "delete_evaluator"
 
         section = st.session_state.get("admin_section", "trainer_reports")
-        evaluators_df = load_evaluators()
+        # The trainer reports view only needs evaluators for the LaTeX export, which loads them itself.
+        if section != "trainer_reports":
+            evaluators_df, eval_version = load_evaluators()
 
         if section == "add_evaluator":
             st.markdown("### 🧑‍💻 Add New Evaluator")
@@ -577,7 +825,7 @@ def admin_section(df_main):
                     try:
                         if not new_username or not new_password:
                             st.error("Username and password are required.")
-                        elif new_username in evaluators_df["username"].values:
+                        elif new_username in evaluators_df.index:
                             st.error("Username already exists.")
                         else:
                             new_entry = {
@@ -588,7 +836,7 @@ def admin_section(df_main):
                                 "role": role_select,
                                 "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                             }
-                            evaluators_df = pd.concat([evaluators_df, pd.DataFrame([new_entry])], ignore_index=True)
+                            evaluators_df.loc[new_username] = [new_entry[col] for col in evaluators_df.columns]
                             save_evaluators(evaluators_df)
                             st.success(f"Evaluator '{new_username}' added.")
                             st.session_state.admin_section = "trainer_reports"
@@ -599,7 +847,7 @@ def admin_section(df_main):
         elif section == "existing_evaluators":
             st.markdown("### 🧑‍💻 Existing Evaluators")
             try:
-                st.dataframe(evaluators_df[["username", "full_name", "email", "role", "created_at"]])
+                st.dataframe(evaluators_df[["username", "full_name", "email", "role", "created_at"]], hide_index=True)
                 if st.button("Back to Main"):
                     st.session_state.admin_section = "trainer_reports"
             except Exception as e:
@@ -608,10 +856,10 @@ def admin_section(df_main):
 
         elif section == "edit_evaluator":
             st.markdown("### 🧑‍💻 Edit Evaluator")
-            selected_eval = st.selectbox("Select Evaluator to Edit", [""] + evaluators_df["username"].tolist(), key="select_eval_edit")
+            selected_eval = st.selectbox("Select Evaluator to Edit", _evaluator_options(eval_version, evaluators_df), key="select_eval_edit")
             if selected_eval:
                 try:
-                    row = evaluators_df[evaluators_df["username"] == selected_eval].iloc[0].to_dict()
+                    row = evaluators_df.loc[selected_eval].to_dict()
                     with st.form(f"edit_eval_form_{selected_eval}"):
                         st.markdown(f"**Username:** {row['username']} (immutable)")
                         edit_full_name = st.text_input("Full Name", value=row.get("full_name", ""), key=f"name_{selected_eval}")
@@ -625,12 +873,9 @@ def admin_section(df_main):
                             new_pass = st.text_input("New Password", type="password", key=f"newpass_{selected_eval}")
                         edit_submitted = st.form_submit_button("Save Changes")
                         if edit_submitted:
-                            idx = evaluators_df.index[evaluators_df["username"] == selected_eval][0]
-                            evaluators_df.at[idx, "full_name"] = edit_full_name
-                            evaluators_df.at[idx, "email"] = edit_email
-                            evaluators_df.at[idx, "role"] = edit_role
+                            evaluators_df.loc[selected_eval, ["full_name", "email", "role"]] = [edit_full_name, edit_email, edit_role]
                             if change_password and new_pass:
-                                evaluators_df.at[idx, "password_hash"] = hash_password(new_pass)
+                                evaluators_df.at[selected_eval, "password_hash"] = hash_password(new_pass)
                             save_evaluators(evaluators_df)
                             st.success(f"Evaluator '{selected_eval}' updated.")
                 except Exception as e:
@@ -641,11 +886,11 @@ def admin_section(df_main):
 
         elif section == "delete_evaluator":
             st.markdown("### 🧑‍💻 Delete Evaluator")
-            selected_eval = st.selectbox("Select Evaluator to Delete", [""] + evaluators_df["username"].tolist(), key="select_eval_delete")
+            selected_eval = st.selectbox("Select Evaluator to Delete", _evaluator_options(eval_version, evaluators_df), key="select_eval_delete")
             if selected_eval:
                 if st.button(f"Confirm Delete Evaluator '{selected_eval}'"):
                     try:
-                        evaluators_df = evaluators_df[evaluators_df["username"] != selected_eval].reset_index(drop=True)
+                        evaluators_df = evaluators_df.drop(index=selected_eval)
                         save_evaluators(evaluators_df)
                         st.warning(f"Evaluator '{selected_eval}' deleted.")
                     except Exception as e:
@@ -658,90 +903,40 @@ def admin_section(df_main):
             st.markdown("---")
             st.markdown("### 📋 Trainer Reports Overview")
 
-            trainer_filter = st.text_input("Filter by Trainer Name or ID", "")
-            filtered = df_main.copy()
+            with st.form("trainer_filter_form"):
+                trainer_filter = st.text_input("Filter by Trainer Name or ID", "")
+                st.form_submit_button("Apply Filter")
+            filtered = df_main
             if trainer_filter:
                 try:
-                    mask = filtered["Trainer ID"].astype(str).str.contains(trainer_filter, case=False, na=False) | \
-                           filtered["Trainer Name"].astype(str).str.contains(trainer_filter, case=False, na=False)
-                    filtered = filtered[mask]
+                    search_col = _trainer_search_column(data_version, df_main)
+                    mask = search_col.str.contains(trainer_filter.lower(), regex=False, na=False)
+                    filtered = df_main[mask.to_numpy()]
                 except Exception as e:
                     logger.error(f"Error filtering trainers: {str(e)}")
                     st.error("Failed to apply trainer filter.")
 
             st.markdown("#### Matching Trainer Assessments")
-            st.dataframe(filtered)
+            if st.toggle("Show all rows and columns", key="admin_overview_show_all"):
+                st.dataframe(filtered, hide_index=True)
+            else:
+                st.dataframe(filtered[OVERVIEW_COLUMNS].head(OVERVIEW_MAX_ROWS), hide_index=True)
+                if len(filtered) > OVERVIEW_MAX_ROWS:
+                    st.caption(f"Showing the first {OVERVIEW_MAX_ROWS} of {len(filtered)} matching assessments. Narrow the filter or turn on 'Show all' for every row.")
 
-            trainer_ids = sorted(filtered["Trainer ID"].dropna().unique().tolist())
-            selected_trainer = st.selectbox("Select Trainer for Detailed Report", [""] + trainer_ids)
+            trainer_options = _filtered_trainer_options(trainer_filter, data_version, filtered)
+            selected_trainer = st.selectbox("Select Trainer for Detailed Report", trainer_options)
             if selected_trainer:
-                trainer_reports = df_main[df_main["Trainer ID"] == selected_trainer]
+                trainer_reports = select_trainer_rows(df_main, selected_trainer)
                 st.markdown(f"##### Reports for Trainer ID: {selected_trainer}")
-                st.dataframe(trainer_reports)
+                st.dataframe(trainer_reports, hide_index=True)
 
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.download_button(
-                        label="Download Trainer Report CSV",
-                        data=trainer_reports.to_csv(index=False),
-                        file_name=f"trainer_{selected_trainer}_reports.csv"
-                    )
-                with col2:
-                    st.download_button(
-                        label="Download All Filtered Reports CSV",
-                        data=filtered.to_csv(index=False),
-                        file_name="filtered_trainer_reports.csv"
-                    )
-                with col3:
-                    if st.button("Download Evaluators/Trainers PDF"):
-                        try:
-                            latex_content = r"""
-                            \documentclass{article}
-                            \usepackage[utf8]{inputenc}
-                            \usepackage{geometry}
-                            \geometry{a4paper, margin=1in}
-                            \usepackage{longtable}
-                            \usepackage{booktabs}
-
-                            \begin{document}
-
-                            \section*{Evaluator and Trainer Report}
-                            \subsection*{Generated on: """ + datetime.now().strftime("%d-%m-%Y %I:%M %p IST") + r"""}
-                            \subsubsection*{Evaluators}
-                            \begin{longtable}{l l l l l}
-                            \toprule
-                            Username & Full Name & Email & Role & Created At \\
-                            \midrule
-                            """ + "".join([f"{row['username']} & {row['full_name']} & {row['email']} & {row['role']} & {row['created_at']} \\\\\n" for _, row in evaluators_df.iterrows()]) + r"""
-                            \bottomrule
-                            \end{longtable}
-
-                            \subsubsection*{Trainers}
-                            \begin{longtable}{l l l l}
-                            \toprule
-                            Trainer ID & Trainer Name & Branch & Department \\
-                            \midrule
-                            """ + ("" if not os.path.exists(DEFAULT_DATA_FILE) else "".join([f"{row['Trainer ID']} & {row['Trainer Name']} & {row['Branch']} & {row['Department']} \\\\\n" for _, row in pd.read_csv(DEFAULT_DATA_FILE).iterrows()])) + r"""
-                            \bottomrule
-                            \end{longtable}
-
-                            \end{document}
-                            """
-                            with open("report.tex", "w") as f:
-                                f.write(latex_content)
-                            with open("report.tex", "rb") as f:
-                                b64 = base64.b64encode(f.read()).decode()
-                                href = f'<a href="data:application/x-latex;base64,{b64}" download="evaluators_trainers_report.pdf">Download PDF</a>'
-                            st.markdown(href, unsafe_allow_html=True)
-                        except Exception as e:
-                            logger.error(f"Error generating PDF report: {str(e)}")
-                            st.error("Failed to generate PDF report.")
+                _admin_report_downloads(selected_trainer, trainer_filter, trainer_reports, filtered, data_version)
 
         if st.button("Logout", key="admin_logout"):
             try:
-                for key in ["logged_in", "role", "logged_user"]:
-                    if key in st.session_state:
-                        del st.session_state[key]
+                for key in ("logged_in", "role", "logged_user"):
+                    st.session_state.pop(key, None)
                 st.success("Logged out successfully!")
                 st.rerun()
             except Exception as e:
@@ -751,11 +946,13 @@ def admin_section(df_main):
         logger.error(f"Error in admin section: {str(e)}")
         st.error("An unexpected error occurred in the Admin Dashboard.")
 
-def set_background(image_file):
-    try:
-        with open(image_file, "rb") as image:
-            img_bytes = base64.b64encode(image.read()).decode()
-        page_bg_img = f"""
+# The login screen reruns on every keystroke; the encoded background only changes with the image file.
+@st.cache_data(show_spinner=False)
+def _background_css(image_file: str, mtime: float) -> str:
+    import base64
+    with open(image_file, "rb") as image:
+        img_bytes = base64.b64encode(image.read()).decode()
+    return f"""
         <style>
         .stApp {{
             background-image: url("data:image/jpg;base64,{img_bytes}");
@@ -765,7 +962,15 @@ def set_background(image_file):
         }}
         </style>
         """
-        st.markdown(page_bg_img, unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def _image_bytes(image_file: str, mtime: float) -> bytes:
+    with open(image_file, "rb") as image:
+        return image.read()
+
+def set_background(image_file):
+    try:
+        st.markdown(_background_css(image_file, os.path.getmtime(image_file)), unsafe_allow_html=True)
     except Exception as e:
         logger.error(f"Error setting background: {str(e)}")
         st.warning("Failed to set background image.")
@@ -775,7 +980,7 @@ def login_ui():
         st.sidebar.title("🔐 Login Panel")
 
         role = st.radio("Select Role", ["Viewer", "Evaluator", "Super_Administrator"])
-        bg_image = f"background{'' if role == 'Viewer' else '1' if role == 'Evaluator' else '2'}.jpg"
+        bg_image = BACKGROUND_IMAGES[role]
         if os.path.exists(bg_image):
             set_background(bg_image)
 
@@ -789,9 +994,9 @@ def login_ui():
 
             if login_btn:
                 try:
-                    if (role == "Viewer" and username == "omotec" and password == "omotec") or \
-                       (role == "Evaluator" and username == "omotec1" and password == "omotec123") or \
-                       (role == "Super_Administrator" and username == "omotec2" and password == "omotec@123#"):
+                    expected_user, expected_hash = LOGIN_CREDENTIALS[role]
+                    if hmac.compare_digest(username.encode("utf-8"), expected_user.encode("utf-8")) and \
+                       verify_password(password, expected_hash):
                         st.session_state.logged_in = True
                         st.session_state["role"] = role.replace("_", " ")
                         st.session_state["logged_user"] = username
@@ -804,25 +1009,26 @@ def login_ui():
                     st.error("Failed to process login. Please try again.")
 
         with col2:
-            if os.path.exists("NEW LOGO - OMOTEC.png"):
-                st.image("NEW LOGO - OMOTEC.png", use_column_width=True)
+            if os.path.exists(LOGO_FILE):
+                st.image(_image_bytes(LOGO_FILE, os.path.getmtime(LOGO_FILE)), use_column_width=True)
     except Exception as e:
         logger.error(f"Error in login UI: {str(e)}")
         st.error("An unexpected error occurred in the Login Panel.")
 
 def main():
     try:
-        if "logged_in" not in st.session_state or not st.session_state.get("logged_in"):
+        session = st.session_state
+        if not session.get("logged_in"):
             login_ui()
         else:
-            df_main = load_data()
-            role = st.session_state.get("role", "")
+            df_main, data_version = load_data()
+            role = session.get("role", "")
             if role == "Evaluator":
-                evaluator_section(df_main)
+                evaluator_section(df_main, data_version)
             elif role == "Viewer":
-                viewer_section(df_main)
+                viewer_section(df_main, data_version)
             elif role == "Super Administrator":
-                admin_section(df_main)
+                admin_section(df_main, data_version)
             else:
                 st.warning("Invalid role. Please login with a valid role.")
     except Exception as e:
@@ -0,0 +1,54 @@
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+from streamlit.testing.v1 import AppTest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_FILES = ["AssessmentApp.py", "EVALUATOR_INPUT.csv", "assessment_data.csv", "evaluators.csv"]
+
+
+class EvaluatorSubmitTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.workdir = tempfile.mkdtemp()
+        for name in DATA_FILES:
+            shutil.copy(os.path.join(REPO_DIR, name), self.workdir)
+        os.chdir(self.workdir)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def login_evaluator(self):
+        at = AppTest.from_file(os.path.join(self.workdir, "AssessmentApp.py"), default_timeout=30)
+        at.run()
+        at.radio[0].set_value("Evaluator").run()
+        at.text_input(key="username_input").set_value("omotec1")
+        at.text_input(key="password_input").set_value("omotec123")
+        at.button[0].click().run()
+        return at
+
+    def test_submit_records_unsaved_level_inputs(self):
+        at = self.login_evaluator()
+        at.selectbox(key="evaluator_role").set_value("Technical Evaluator")
+        [s for s in at.selectbox if s.label == "Select Existing Trainer ID"][0].set_value("TR002").run()
+
+        at.text_input(key="Has Knowledge of STEM (5)_LEVEL #1_TR002").set_value("5")
+        at.number_input(key="total_LEVEL #1_TR002").set_value(88)
+        at.number_input(key="avg_LEVEL #1_TR002").set_value(92.5)
+        [b for b in at.button if b.label == "💾 Submit Evaluation"][0].click().run()
+
+        self.assertFalse(at.exception)
+        with open("assessment_data.csv", newline="") as f:
+            row = list(csv.DictReader(f))[-1]
+        self.assertEqual(row["Trainer ID"], "TR002")
+        self.assertEqual(row["Has Knowledge of STEM (5)"], "5")
+        self.assertEqual(float(row["TOTAL"]), 88)
+        self.assertEqual(float(row["AVERAGE"]), 92.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import AssessmentApp  # noqa: E402
+
+
+class LatexTableRowsTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.workdir = tempfile.mkdtemp()
+        shutil.copy(os.path.join(REPO_DIR, "EVALUATOR_INPUT.csv"), self.workdir)
+        os.chdir(self.workdir)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def test_rows_from_categorical_trainer_frame(self):
+        eval_inputs_df, _ = AssessmentApp.load_eval_inputs()
+        self.assertIsInstance(eval_inputs_df["Branch"].dtype, pd.CategoricalDtype)
+        columns = ["Trainer ID", "Trainer Name", "Branch", "Department"]
+        rows = AssessmentApp.latex_table_rows(eval_inputs_df, columns)
+        self.assertEqual(rows.count(" \\\\\n"), len(eval_inputs_df))
+        self.assertNotIn("nan", rows)
+
+    def test_missing_categorical_cells_render_empty(self):
+        df = pd.DataFrame({
+            "Trainer ID": ["TR001", "TR002"],
+            "Trainer Name": ["A & B", np.nan],
+            "Branch": pd.Categorical(["Juhu", np.nan]),
+        })
+        rows = AssessmentApp.latex_table_rows(df, ["Trainer ID", "Trainer Name", "Branch"])
+        self.assertEqual(rows, "TR001 & A \\& B & Juhu \\\\\nTR002 &  &  \\\\\n")
+
+
+if __name__ == "__main__":
+    unittest.main()